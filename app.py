@@ -4,10 +4,14 @@ Streamlit Web Application for the Skin Cancer Mutation AI Assistant.
 
 import streamlit as st
 import logging
+from src.core.config import CONFIG
 from src.main import create_rag_engine
+from src.utils.memory import memory_footprint, format_footprint, trim_history
 
 logger = logging.getLogger(__name__)
 
+MAX_CHAT_HISTORY = CONFIG.get('memory_budget', {}).get('max_chat_history', 0)
+
 # --- Page Configuration ---
 st.set_page_config(
     page_title="Skin Cancer AI Assistant",
@@ -32,72 +36,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# --- Sidebar ---
-with st.sidebar:
-    st.image("https://img.icons8.com/fluency/96/dna-helix.png", width=80)
-    st.title("Onco-RAG Assistant")
-    st.markdown("---")
-    st.markdown("""
-    **System Status:**
-    - 🟢 LLM Engine: **Llama-3.2-1B**
-    - 🟢 Knowledge Base: **Mol-Instructions**
-    - 🟢 Fact-Checking: **UniProt API**
-    """)
-    st.markdown("---")
-    st.info("This tool is designed for clinical research and educational purposes.")
-
-# --- Main Interface ---
-st.title("🧬 Skin Cancer Mutation Analysis System")
-st.markdown("""
-Welcome to the **RAG-powered Clinical Assistant**. 
-Ask questions about skin cancer mutations (e.g., *BRAF V600E*, *NRAS*, *TP53*) to get evidence-based answers.
-""")
-
-# Initialize Session State
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-
-if "rag_engine" not in st.session_state:
-    with st.spinner("Initializing AI Engine... (This may take a minute)"):
-        try:
-            st.session_state.rag_engine = create_rag_engine()
-            st.success("System Ready!")
-        except Exception as e:
-            st.error(f"System Initialization Failed: {e}")
-
-# Display Chat History
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
-
-# Chat Input
-if prompt := st.chat_input("Ask a question about a mutation (e.g., 'What is the clinical significance of BRAF V600E?')..."):
-    # Add user message to history
-    st.session_state.messages.append({"role": "user", "content": prompt})
-    with st.chat_message("user"):
-        st.markdown(prompt)
-
-    # Generate Response
-    with st.chat_message("assistant"):
-        with st.spinner("Analyzing scientific literature and protein databases..."):
-            try:
-                response_obj = st.session_state.rag_engine.query(prompt)
-                response_text = response_obj["response"]
-                
-                st.markdown(response_text)
-                
-                # Add assistant response to history
-                st.session_state.messages.append({"role": "assistant", "content": response_text})
-                
-                # Show sources in an expander
-                with st.expander("📚 View Scientific Sources"):
-                    for node in response_obj["source_nodes"]:
-                        st.markdown(f"- {node.get_text()[:200]}...")
-                        
-            except Exception as e:
-                st.error(f"An error occurred: {e}")
-
-
 # --- Initialization and Caching ---
 @st.cache_resource
 def get_rag_engine():
@@ -134,6 +72,13 @@ with st.sidebar:
     - **Framework:** `LlamaIndex`
     """)
     st.markdown("---")
+    with st.expander("Memory Footprint"):
+        footprint = memory_footprint(query_engine, st.session_state.get("messages"))
+        for line in format_footprint(footprint):
+            st.caption(line)
+    with st.expander("Request Coalescing"):
+        for layer, stats in query_engine.coalescing_stats.items():
+            st.caption(f"**{layer}:** {stats['executions']} executed, {stats['coalesced']} coalesced")
     if st.button("Clear Chat History"):
         st.session_state.messages = []
         st.success("Chat history cleared.")
@@ -156,6 +101,7 @@ for message in st.session_state.messages:
 if prompt := st.chat_input("e.g., 'What is the clinical significance of BRAF V600E?'"):
     # Add user message to history and display it
     st.session_state.messages.append({"role": "user", "content": prompt})
+    trim_history(st.session_state.messages, MAX_CHAT_HISTORY)
     with st.chat_message("user"):
         st.markdown(prompt)
 
@@ -186,9 +132,11 @@ if prompt := st.chat_input("e.g., 'What is the clinical significance of BRAF V60
                 
                 # Add the full response to session state
                 st.session_state.messages.append({"role": "assistant", "content": answer})
+                trim_history(st.session_state.messages, MAX_CHAT_HISTORY)
 
             except Exception as e:
                 error_message = f"Sorry, an error occurred while processing your request. Please try again."
                 st.error(error_message)
                 logger.error(f"Query processing error: {e}")
-                st.session_state.messages.append({"role": "assistant", "content": error_message})
\ No newline at end of file
+                st.session_state.messages.append({"role": "assistant", "content": error_message})
+                trim_history(st.session_state.messages, MAX_CHAT_HISTORY)
\ No newline at end of file
@@ -2,6 +2,7 @@ import logging
 from typing import List, Dict, Any
 from llama_index.core.query_engine import BaseQueryEngine
 from src.utils.uniprot import UniProtCache
+from src.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +15,29 @@ class UniProtEnrichedQueryEngine(BaseQueryEngine):
         self.llm = llm
         self.prompt_template = prompt_template
         self.uniprot_cache = UniProtCache()
+        self._inflight = SingleFlight()
         try:
             self.uniprot_cache.preload_cancer_proteins()
         except Exception as e:
             logger.warning(f"Could not preload UniProt data: {e}")
-        super().__init__(retriever)
+        super().__init__(callback_manager=None)
+
+    @staticmethod
+    def _normalize_query(query_str: str) -> str:
+        return " ".join(query_str.split()).lower()
+
+    def query(self, str_or_query_bundle):
+        """Runs the query, sharing one execution among identical concurrent queries."""
+        query_str = getattr(str_or_query_bundle, 'query_str', str_or_query_bundle)
+        key = self._normalize_query(query_str)
+        return self._inflight.do(key, lambda: self._query(query_str))
+
+    @property
+    def coalescing_stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "query": self._inflight.stats,
+            "uniprot": self.uniprot_cache.coalescing_stats,
+        }
 
     def _extract_proteins(self, text: str) -> List[str]:
         text_upper = text.upper()
@@ -64,3 +83,10 @@ class UniProtEnrichedQueryEngine(BaseQueryEngine):
         except Exception as e:
             logger.error(f"Error in query execution: {e}")
             raise
+
+    async def _aquery(self, query_bundle) -> Dict[str, Any]:
+        # BaseQueryEngine.aquery wraps the string in a QueryBundle; _query expects the text.
+        return self._query(query_bundle.query_str)
+
+    def _get_prompt_modules(self) -> Dict[str, Any]:
+        return {}
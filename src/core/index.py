@@ -8,9 +8,11 @@ from src.core.config import CONFIG
 
 logger = logging.getLogger(__name__)
 
-def get_or_build_index(documents):
+def get_or_build_index(load_documents):
     """
-    Builds or loads a persistent ChromaDB vector index.
+    Builds or loads a persistent ChromaDB vector index. `load_documents` is only
+    called when the collection is empty, so an existing index never pulls the
+    raw dataset into memory.
     """
     vs_config = CONFIG['vector_store']
     parser_config = CONFIG.get('node_parser', {'chunk_size': 512})
@@ -23,6 +25,10 @@ def get_or_build_index(documents):
     vector_store = ChromaVectorStore(chroma_collection=chroma_collection)
     
     if chroma_collection.count() == 0:
+        documents = load_documents()
+        if not documents:
+            raise ValueError("No documents loaded from dataset")
+
         logger.info("Building new vector index...")
         storage_context = StorageContext.from_defaults(vector_store=vector_store)
         index = VectorStoreIndex.from_documents(
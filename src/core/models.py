@@ -1,4 +1,7 @@
+import gc
 import logging
+import threading
+import time
 import torch
 from transformers import BitsAndBytesConfig
 from llama_index.core import Settings
@@ -8,10 +11,68 @@ from src.core.config import CONFIG
 
 logger = logging.getLogger(__name__)
 
-def configure_models():
-    """Initializes and configures the global LLM and embedding models."""
-    logger.info("Configuring models...")
-    
+class IdleOffloadLLM:
+    """
+    Wraps the LLM so it is released after a period of inactivity and reloaded
+    lazily on the next call. The model is built once up front so startup
+    reflects real serving behaviour.
+    """
+    def __init__(self, factory, idle_timeout: float):
+        self.factory = factory
+        self.idle_timeout = idle_timeout
+        self._active = 0
+        self._timer = None
+        self._lock = threading.Lock()
+        self._llm = factory()
+        self._last_used = time.monotonic()
+        with self._lock:
+            self._schedule_offload()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._llm is not None
+
+    @property
+    def llm(self):
+        """Returns the underlying LLM if it is currently resident, else None."""
+        return self._llm
+
+    def complete(self, prompt: str, **kwargs):
+        with self._lock:
+            if self._llm is None:
+                logger.info("Loading LLM on demand...")
+                self._llm = self.factory()
+            llm = self._llm
+            self._active += 1
+        try:
+            return llm.complete(prompt, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._last_used = time.monotonic()
+                self._schedule_offload()
+
+    def _schedule_offload(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.idle_timeout, self.offload)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def offload(self, force: bool = False):
+        """Releases the LLM if it has been idle for at least `idle_timeout` seconds."""
+        with self._lock:
+            if self._llm is None or self._active:
+                return
+            if not force and time.monotonic() - self._last_used < self.idle_timeout:
+                return
+            logger.info("Offloading idle LLM...")
+            self._llm = None
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+def _build_llm():
     model_config = CONFIG['models']
     llm_gen_config = CONFIG.get('llm_generation', {
         'context_window': 2048,
@@ -27,7 +88,7 @@ def configure_models():
         bnb_4bit_use_double_quant=True,
     )
 
-    Settings.llm = HuggingFaceLLM(
+    return HuggingFaceLLM(
         model_name=model_config['llm'],
         tokenizer_name=model_config['llm'],
         context_window=llm_gen_config['context_window'],
@@ -40,5 +101,25 @@ def configure_models():
         device_map="auto",
     )
 
+def configure_models():
+    """
+    Initializes and configures the global LLM and embedding models.
+    Returns the LLM the query engine should use.
+    """
+    logger.info("Configuring models...")
+
+    model_config = CONFIG['models']
+    budget_config = CONFIG.get('memory_budget', {})
+    idle_timeout = budget_config.get('llm_idle_timeout', 0)
+
+    if idle_timeout > 0:
+        # Keep the model out of Settings so the offloader holds the only reference.
+        logger.info(f"LLM will be offloaded after {idle_timeout}s idle and reloaded on demand.")
+        llm = IdleOffloadLLM(_build_llm, idle_timeout)
+    else:
+        llm = _build_llm()
+        Settings.llm = llm
+
     Settings.embed_model = HuggingFaceEmbedding(model_name=model_config['embedding'])
     logger.info("Models configured successfully.")
+    return llm
@@ -1,11 +1,12 @@
 import logging
-from llama_index.core import Settings, PromptTemplate
+from llama_index.core import PromptTemplate
 from llama_index.core.retrievers import VectorIndexRetriever
 from src.core.config import CONFIG
 from src.core.models import configure_models
 from src.data.loader import load_mol_instructions
 from src.core.index import get_or_build_index
 from src.core.engine import UniProtEnrichedQueryEngine
+from src.utils.memory import memory_footprint, format_footprint
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +18,8 @@ def create_rag_engine():
     logger.info("INITIALIZING RAG PIPELINE")
     
     try:
-        configure_models()
-        documents = load_mol_instructions()
-        if not documents:
-            raise ValueError("No documents loaded from dataset")
-        
-        index = get_or_build_index(documents)
+        llm = configure_models()
+        index = get_or_build_index(load_mol_instructions)
         
         retriever_config = CONFIG['retriever']
         retriever = VectorIndexRetriever(index=index, similarity_top_k=retriever_config['similarity_top_k'])
@@ -32,11 +29,13 @@ def create_rag_engine():
         logger.info("Creating UniProt-enriched query engine...")
         query_engine = UniProtEnrichedQueryEngine(
             retriever=retriever,
-            llm=Settings.llm,
+            llm=llm,
             prompt_template=prompt_template
         )
         
         logger.info("✅ RAG Pipeline Initialized Successfully!")
+        footprint = memory_footprint(query_engine)
+        logger.info("Memory footprint: " + "; ".join(format_footprint(footprint)))
         logger.info("="*50)
         
         return query_engine
@@ -0,0 +1,93 @@
+import sys
+import itertools
+import resource
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+def _deep_sizeof(obj, seen=None) -> int:
+    """Approximates the in-memory size of nested dicts, lists and strings."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    return size
+
+def _module_bytes_by_device(module) -> Tuple[int, int]:
+    """
+    Splits a torch module's parameter and buffer bytes into (host, device).
+    Counted per tensor, since device_map="auto" can place one model on both.
+    """
+    host = device = 0
+    if module is None:
+        return host, device
+    for tensor in itertools.chain(module.parameters(), module.buffers()):
+        # Weights offloaded to disk live on the meta device and hold no memory.
+        if tensor.device.type == "meta":
+            continue
+        size = tensor.numel() * tensor.element_size()
+        if tensor.device.type == "cpu":
+            host += size
+        else:
+            device += size
+    return host, device
+
+def process_rss() -> int:
+    """Returns the current resident set size of the process in bytes."""
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        pages = int(statm.read_text().split()[1])
+        return pages * resource.getpagesize()
+    # Peak RSS is the best we can do without /proc; macOS reports bytes, Linux KiB.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def trim_history(messages: List[Dict], max_messages: int) -> List[Dict]:
+    """Drops the oldest chat messages in place so at most `max_messages` remain."""
+    if max_messages and len(messages) > max_messages:
+        del messages[:len(messages) - max_messages]
+    return messages
+
+def memory_footprint(query_engine, messages: Optional[List[Dict]] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Reports memory in bytes, split into host (process RSS) and device (GPU) usage and
+    broken down by component. Host memory that cannot be attributed directly, including
+    the Chroma client, is reported as 'other'.
+    """
+    import torch
+    from llama_index.core import Settings
+
+    llm = getattr(query_engine, 'llm', None)
+    # IdleOffloadLLM exposes the wrapped LLM only while it is resident.
+    llm = getattr(llm, 'llm', llm)
+    models = {
+        "llm": getattr(llm, '_model', None),
+        "embedding": getattr(Settings._embed_model, '_model', None),
+    }
+
+    host, device = {}, {}
+    for name, module in models.items():
+        host[name], device[name] = _module_bytes_by_device(module)
+
+    host["uniprot_cache"] = _deep_sizeof(query_engine.uniprot_cache.snapshot())
+    host["chat_history"] = _deep_sizeof(messages or [])
+    total = process_rss()
+    host["other"] = max(total - sum(host.values()), 0)
+    host["total_rss"] = total
+
+    device["total_allocated"] = torch.cuda.memory_allocated() if torch.cuda.is_available() else 0
+    return {"host": host, "device": device}
+
+def format_footprint(footprint: Dict[str, Dict[str, int]]) -> List[str]:
+    """Renders a memory_footprint() report as one human-readable line per component."""
+    labels = {"other": "other (Chroma client, runtime)"}
+    return [
+        f"{kind} {labels.get(name, name)}: {size / 1024**2:.1f} MB"
+        for kind, report in footprint.items()
+        for name, size in report.items()
+    ]
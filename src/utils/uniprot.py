@@ -1,7 +1,15 @@
 import json
+import threading
 import requests
 from pathlib import Path
 from typing import Dict, Optional
+from src.utils.singleflight import SingleFlight
+
+# Cache contents, write lock and in-flight lookups are shared by every instance
+# backed by the same cache file, so concurrent engines don't duplicate API calls
+# or race on writes.
+_shared_state_lock = threading.Lock()
+_shared_state = {}
 
 class UniProtCache:
     """Creating Cached access to UniProt protein database"""
@@ -10,7 +18,11 @@ class UniProtCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_file = self.cache_dir / "uniprot_cache.json"
-        self.cache = self._load_cache()
+        with _shared_state_lock:
+            key = self.cache_file.resolve()
+            if key not in _shared_state:
+                _shared_state[key] = (self._load_cache(), threading.Lock(), SingleFlight())
+            self.cache, self._save_lock, self._inflight = _shared_state[key]
 
         # Listing some common skin cancer proteins
         self.cancer_proteins = [
@@ -24,9 +36,21 @@ class UniProtCache:
                 return json.load(f)
         return {}
 
+    def snapshot(self) -> Dict[str, Dict]:
+        """Returns a copy of the cache that is safe to iterate while lookups run."""
+        with self._save_lock:
+            return dict(self.cache)
+
     def _save_cache(self):
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f, indent=2)
+        # Serialise writers and dump a snapshot so concurrent inserts can't corrupt the file.
+        with self._save_lock:
+            snapshot = dict(self.cache)
+            with open(self.cache_file, 'w') as f:
+                json.dump(snapshot, f, indent=2)
+
+    @property
+    def coalescing_stats(self) -> Dict[str, int]:
+        return self._inflight.stats
 
     def preload_cancer_proteins(self):
         """Preloads data for known cancer proteins."""
@@ -38,6 +62,14 @@ class UniProtCache:
         """Fetches protein info from UniProt API or cache."""
         gene_name = gene_name.upper()
         
+        if gene_name in self.cache:
+            return self.cache[gene_name]
+
+        # Concurrent misses for the same gene share a single API request.
+        return self._inflight.do(gene_name, lambda: self._fetch_from_api(gene_name))
+
+    def _fetch_from_api(self, gene_name: str) -> Optional[Dict]:
+        # A previous flight may have filled the cache after our cache check.
         if gene_name in self.cache:
             return self.cache[gene_name]
 
@@ -0,0 +1,76 @@
+"""
+Unit tests for query coalescing in UniProtEnrichedQueryEngine.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from llama_index.core import PromptTemplate
+from src.core.engine import UniProtEnrichedQueryEngine
+
+@pytest.fixture
+def engine(mocker):
+    """Fixture for an engine with a slow mocked retriever, a mocked LLM and no UniProt API."""
+    mocker.patch("src.core.engine.UniProtCache")
+    node = MagicMock()
+    node.get_text.return_value = "BRAF V600E is a common driver mutation in melanoma."
+
+    def slow_retrieve(query_str):
+        time.sleep(0.2)
+        return [node]
+
+    retriever = MagicMock()
+    retriever.retrieve.side_effect = slow_retrieve
+    llm = MagicMock()
+    llm.complete.return_value = "answer"
+
+    engine = UniProtEnrichedQueryEngine(
+        retriever=retriever,
+        llm=llm,
+        prompt_template=PromptTemplate("{context_str}\nQuery: {query_str}\nAnswer:")
+    )
+    engine.uniprot_cache.cancer_proteins = ['BRAF']
+    engine.uniprot_cache.fetch_protein_info.return_value = {
+        "gene": "BRAF", "protein_name": "Proto-oncogene B-Raf", "function": "Protein kinase."
+    }
+    return engine
+
+def test_normalize_query_ignores_case_and_whitespace():
+    """
+    Test that queries differing only in case and whitespace normalize to one key.
+    """
+    assert UniProtEnrichedQueryEngine._normalize_query("  BRAF   V600E ") == "braf v600e"
+    assert UniProtEnrichedQueryEngine._normalize_query("braf v600e") == "braf v600e"
+
+def test_query_returns_response_and_sources(engine):
+    """
+    Test that a single query runs retrieval, UniProt enrichment and generation.
+    """
+    result = engine.query("What is BRAF V600E?")
+
+    assert result["response"] == "answer"
+    assert len(result["source_nodes"]) == 1
+    engine.uniprot_cache.fetch_protein_info.assert_called_once_with('BRAF')
+    assert "Proto-oncogene B-Raf" in engine.llm.complete.call_args.args[0]
+
+def test_equivalent_concurrent_queries_share_one_flight(engine):
+    """
+    Test that "  BRAF V600E " and "braf v600e" run retrieval and generation once.
+    """
+    results = []
+    threads = [
+        threading.Thread(target=lambda q=q: results.append(engine.query(q)))
+        for q in ["  BRAF V600E ", "braf v600e"]
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    engine.retriever.retrieve.assert_called_once()
+    engine.llm.complete.assert_called_once()
+    assert len(results) == 2
+    assert results[0] is results[1]
+    assert results[0]["response"] == "answer"
+    assert engine.coalescing_stats["query"] == {"executions": 1, "coalesced": 1, "in_flight": 0}
@@ -0,0 +1,70 @@
+"""
+Unit tests for the memory helpers in src/utils/memory.py.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from src.utils.memory import _module_bytes_by_device, memory_footprint, process_rss, trim_history
+from src.utils.uniprot import UniProtCache
+
+def _messages(n):
+    return [{"role": "user", "content": f"message {i}"} for i in range(n)]
+
+def test_trim_history_keeps_newest_messages():
+    """
+    Test that trim_history drops the oldest messages in place.
+    """
+    messages = _messages(5)
+    trimmed = trim_history(messages, 3)
+
+    assert trimmed is messages
+    assert [m["content"] for m in messages] == ["message 2", "message 3", "message 4"]
+
+def test_trim_history_zero_means_unbounded():
+    """
+    Test that a limit of 0 leaves the history untouched.
+    """
+    messages = _messages(5)
+    trim_history(messages, 0)
+
+    assert len(messages) == 5
+
+def test_process_rss_is_positive():
+    """
+    Test that process_rss reports a plausible resident size.
+    """
+    assert process_rss() > 0
+
+def _tensor(device_type, numel, element_size=1):
+    tensor = MagicMock()
+    tensor.device.type = device_type
+    tensor.numel.return_value = numel
+    tensor.element_size.return_value = element_size
+    return tensor
+
+def test_module_bytes_split_across_host_and_device():
+    """
+    Test that a model split by device_map="auto" is attributed per tensor.
+    """
+    module = MagicMock()
+    module.parameters.return_value = [_tensor("cuda", 100, 2), _tensor("cpu", 50, 2), _tensor("meta", 1000)]
+    module.buffers.return_value = [_tensor("cpu", 10)]
+
+    assert _module_bytes_by_device(module) == (110, 200)
+    assert _module_bytes_by_device(None) == (0, 0)
+
+def test_memory_footprint_reports_host_and_device(tmp_path):
+    """
+    Test that the footprint covers every component and sizes a UniProt cache snapshot.
+    """
+    uniprot_cache = UniProtCache(cache_dir=tmp_path)
+    uniprot_cache.cache["BRAF"] = {"gene": "BRAF", "protein_name": "Proto-oncogene B-Raf"}
+    engine = SimpleNamespace(llm=None, uniprot_cache=uniprot_cache)
+
+    footprint = memory_footprint(engine, _messages(3))
+
+    host, device = footprint["host"], footprint["device"]
+    assert set(host) == {"llm", "embedding", "uniprot_cache", "chat_history", "other", "total_rss"}
+    assert set(device) == {"llm", "embedding", "total_allocated"}
+    assert host["uniprot_cache"] > 0 and host["chat_history"] > 0
+    assert host["total_rss"] >= host["uniprot_cache"] + host["chat_history"]
@@ -0,0 +1,72 @@
+"""
+Unit tests for the IdleOffloadLLM wrapper in src/core/models.py.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+from src.core.models import IdleOffloadLLM
+
+IDLE_TIMEOUT = 0.05
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met before deadline"
+        time.sleep(0.01)
+
+def test_model_is_built_at_startup():
+    """
+    Test that the model is built once up front and used by the first call.
+    """
+    factory = MagicMock()
+    llm = IdleOffloadLLM(factory, idle_timeout=60)
+
+    assert llm.is_loaded
+    llm.complete("What is BRAF?")
+
+    factory.assert_called_once()
+    factory.return_value.complete.assert_called_once_with("What is BRAF?")
+
+def test_model_is_offloaded_when_idle_and_rebuilt_on_next_call():
+    """
+    Test that the model is dropped after the idle timeout and rebuilt lazily.
+    """
+    factory = MagicMock()
+    llm = IdleOffloadLLM(factory, idle_timeout=IDLE_TIMEOUT)
+
+    llm.complete("What is BRAF?")
+    _wait_for(lambda: not llm.is_loaded)
+    assert llm.llm is None
+
+    llm.complete("What is TP53?")
+    assert llm.is_loaded
+    assert factory.call_count == 2
+
+def test_model_is_not_offloaded_while_a_call_is_active():
+    """
+    Test that an in-progress generation keeps the model resident past the timeout.
+    """
+    started = threading.Event()
+    release = threading.Event()
+    model = MagicMock()
+
+    def slow_complete(prompt):
+        started.set()
+        release.wait(timeout=5)
+        return "answer"
+
+    model.complete.side_effect = slow_complete
+    llm = IdleOffloadLLM(lambda: model, idle_timeout=IDLE_TIMEOUT)
+
+    worker = threading.Thread(target=llm.complete, args=("What is NRAS?",))
+    worker.start()
+    assert started.wait(timeout=2)
+
+    time.sleep(IDLE_TIMEOUT * 4)
+    llm.offload(force=True)
+    assert llm.is_loaded
+
+    release.set()
+    worker.join(timeout=5)
+    _wait_for(lambda: not llm.is_loaded)
@@ -0,0 +1,96 @@
+"""
+Unit tests for the SingleFlight request coalescer.
+"""
+
+import threading
+import time
+import pytest
+from src.utils.singleflight import SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    """
+    Test that identical concurrent calls run the work once and all receive its result.
+    """
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def work():
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"response": "answer"}
+
+    def caller():
+        results.append(flight.do("braf v600e", work))
+
+    threads = [threading.Thread(target=caller) for _ in range(5)]
+    for t in threads:
+        t.start()
+    # Wait until every follower has joined the in-flight call before releasing it.
+    deadline = time.monotonic() + 5
+    while flight.stats["coalesced"] < 4:
+        assert time.monotonic() < deadline, "followers never joined the in-flight call"
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert len(calls) == 1
+    assert results == [{"response": "answer"}] * 5
+    assert flight.stats == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+def test_errors_propagate_and_key_is_released():
+    """
+    Test that a failed call raises for the caller and does not block later calls.
+    """
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("API down")
+
+    with pytest.raises(ValueError):
+        flight.do("TP53", fail)
+
+    assert flight.do("TP53", lambda: "ok") == "ok"
+    assert flight.stats["executions"] == 2
+
+def test_followers_receive_fresh_chained_exception():
+    """
+    Test that each waiter gets its own exception chained to the leader's error.
+    """
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait(timeout=5)
+        raise ValueError("API down")
+
+    def caller():
+        try:
+            flight.do("NRAS", fail)
+        except Exception as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    assert started.wait(timeout=5)
+    followers = [threading.Thread(target=caller) for _ in range(2)]
+    for t in followers:
+        t.start()
+    deadline = time.monotonic() + 5
+    while flight.stats["coalesced"] < 2:
+        assert time.monotonic() < deadline, "followers never joined the in-flight call"
+        time.sleep(0.01)
+    release.set()
+    for t in [leader] + followers:
+        t.join(timeout=5)
+
+    leader_errors = [e for e in errors if isinstance(e, ValueError)]
+    follower_errors = [e for e in errors if isinstance(e, RuntimeError)]
+    assert len(leader_errors) == 1 and len(follower_errors) == 2
+    assert follower_errors[0] is not follower_errors[1]
+    assert all(e.__cause__ is leader_errors[0] for e in follower_errors)
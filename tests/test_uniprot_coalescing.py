@@ -0,0 +1,73 @@
+"""
+Unit tests for coalescing of concurrent UniProtCache lookups.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from src.utils.uniprot import UniProtCache
+
+N_THREADS = 8
+
+mock_api_response = {
+    "results": [
+        {
+            "primaryAccession": "P15056",
+            "proteinDescription": {"recommendedName": {"fullName": {"value": "Proto-oncogene B-Raf"}}},
+            "comments": [
+                {"commentType": "FUNCTION", "texts": [{"value": "Protein kinase involved in the ERK1/2 signaling pathway."}]}
+            ],
+            "sequence": {"length": 766}
+        }
+    ]
+}
+
+@pytest.fixture
+def slow_requests_get(mocker):
+    """Fixture to mock requests.get with a response that takes a moment to arrive."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = mock_api_response
+
+    def slow_get(*args, **kwargs):
+        time.sleep(0.2)
+        return mock_response
+
+    return mocker.patch("requests.get", side_effect=slow_get)
+
+def _fetch_concurrently(caches, gene_name):
+    results = []
+    threads = [
+        threading.Thread(target=lambda c=c: results.append(c.fetch_protein_info(gene_name)))
+        for c in caches
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+    return results
+
+def test_concurrent_misses_share_one_api_call(slow_requests_get, tmp_path):
+    """
+    Test that concurrent misses for the same gene hit the API once.
+    """
+    cache = UniProtCache(cache_dir=tmp_path)
+
+    results = _fetch_concurrently([cache] * N_THREADS, "braf")
+
+    slow_requests_get.assert_called_once()
+    assert len(results) == N_THREADS
+    assert all(r["accession"] == "P15056" for r in results)
+    assert cache.coalescing_stats == {"executions": 1, "coalesced": N_THREADS - 1, "in_flight": 0}
+
+def test_instances_sharing_a_cache_file_share_lookups(slow_requests_get, tmp_path):
+    """
+    Test that separate instances backed by the same file coalesce and share entries.
+    """
+    caches = [UniProtCache(cache_dir=tmp_path) for _ in range(N_THREADS)]
+
+    _fetch_concurrently(caches, "BRAF")
+
+    slow_requests_get.assert_called_once()
+    assert all("BRAF" in c.cache for c in caches)
+    assert caches[0].coalescing_stats["coalesced"] == N_THREADS - 1